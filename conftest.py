@@ -1,3 +1,6 @@
+import os
+
+import pytest
 from django.conf import settings
 
 
@@ -5,6 +8,60 @@ def pytest_configure():
     settings.DJANGO_SETTINGS_MODULE = "plfog.settings"
 
 
+# Leading fields of the django_db marker, in pytest-django's order.
+_DJANGO_DB_FIELDS = ("transaction", "reset_sequences", "databases", "serialized_rollback", "available_apps")
+
+# Fixtures that flush tables after each test, like django_db(transaction=True).
+_FLUSHING_DB_FIXTURES = {
+    "transactional_db",
+    "django_db_reset_sequences",
+    "django_db_serialized_rollback",
+    "live_server",
+}
+
+
+def _django_db_options(marker):
+    """Read the validated django_db marker options by name.
+
+    Some pytest-django releases return a named tuple, others a plain tuple;
+    neither form breaks here if a later release appends a field.
+    """
+    from pytest_django.plugin import validate_django_db
+
+    db = validate_django_db(marker)
+    if hasattr(db, "_asdict"):
+        return db._asdict()
+    return dict(zip(_DJANGO_DB_FIELDS, db))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag database-free specs and keep every spec on savepoint rollback.
+
+    Specs that never reach the test database are tagged "unit", so
+    ``pytest -m unit`` runs them without creating one.
+
+    ``django_db(transaction=True)`` (and the reset_sequences/serialized_rollback
+    options that require it) flushes tables after the test. That would delete
+    the default membership plan seeded once per session in
+    tests/membership/conftest.py, leaving every later ``MemberFactory()``
+    pointing at a missing row, so such specs are rejected at collection time.
+    """
+    for item in items:
+        marker = item.get_closest_marker("django_db")
+        if marker is None and "django_db_setup" not in item.fixturenames:
+            item.add_marker("unit")
+            continue
+        flushes = bool(_FLUSHING_DB_FIXTURES.intersection(item.fixturenames))
+        if marker is not None:
+            db = _django_db_options(marker)
+            flushes = flushes or db["transaction"] or db["reset_sequences"] or db["serialized_rollback"]
+        if flushes:
+            raise pytest.UsageError(
+                f"{item.nodeid}: specs must not use django_db(transaction=True), reset_sequences, "
+                "serialized_rollback or the transactional_db/live_server fixtures"
+            )
+
+
 def pytest_sessionstart(session):
     from django.conf import settings as django_settings
 
@@ -12,3 +69,21 @@ def pytest_sessionstart(session):
         "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
         "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
     }
+
+    # Specs create users with real passwords (create_superuser, create_user);
+    # the production hasher is deliberately slow, so hash them with MD5 here.
+    django_settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    # PYTEST_FAST=1 runs the suite on in-memory SQLite even when DATABASE_URL
+    # points at PostgreSQL: no fsync, no server round-trips.
+    if os.environ.get("PYTEST_FAST"):
+        from django.db import DEFAULT_DB_ALIAS, connections
+
+        django_settings.DATABASES[DEFAULT_DB_ALIAS] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        }
+        # The connection handler was built from the original settings during
+        # Django setup; rebuild it so the swapped alias takes effect.
+        connections.settings = connections.configure_settings(django_settings.DATABASES)
+        del connections[DEFAULT_DB_ALIAS]
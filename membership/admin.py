@@ -205,13 +205,14 @@ class MemberAdmin(ModelAdmin):
 
 
 # ---------------------------------------------------------------------------
-# GuildAdmin
+# GuildAdmin (N+1 fix: select the nullable guild_lead explicitly)
 # ---------------------------------------------------------------------------
 
 
 @admin.register(Guild)
 class GuildAdmin(ModelAdmin):
     list_display = ["name", "guild_lead", "sublet_count", "notes_preview"]
+    list_select_related = ["guild_lead"]
     search_fields = ["name"]
     inlines = [SubletInline, LeaseInlineGuild]
 
@@ -288,7 +289,7 @@ class SpaceAdmin(ModelAdmin):
 
 
 # ---------------------------------------------------------------------------
-# LeaseAdmin
+# LeaseAdmin (N+1 fix: prefetch generic tenants, one query per tenant type)
 # ---------------------------------------------------------------------------
 
 
@@ -306,6 +307,10 @@ class LeaseAdmin(ModelAdmin):
     list_filter = ["lease_type"]
     search_fields = ["space__space_id"]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Lease]:
+        qs = super().get_queryset(request)
+        return qs.select_related("space", "content_type").prefetch_related("tenant")
+
     @admin.display(description="Tenant")
     def tenant_display(self, obj: Lease) -> str:
         return str(obj.tenant) if obj.tenant else "-"
@@ -150,7 +150,7 @@ class Member(models.Model):
 
     @property
     def active_leases(self) -> models.QuerySet[Lease]:
-        return self.leases.filter(_active_lease_q())
+        return self.leases.filter(_active_lease_q()).select_related("space")
 
     @property
     def current_spaces(self) -> models.QuerySet[Space]:
@@ -211,7 +211,7 @@ class Guild(models.Model):
 
     @property
     def active_leases(self) -> models.QuerySet[Lease]:
-        return self.leases.filter(_active_lease_q())
+        return self.leases.filter(_active_lease_q()).select_related("space")
 
     @property
     def sublet_revenue(self) -> Decimal:
@@ -342,7 +342,7 @@ class Space(models.Model):
     @property
     def current_occupants(self) -> list[Member | Guild]:
         """Return all active tenants (Members and Guilds) for this space."""
-        active = self.leases.filter(_active_lease_q()).select_related("content_type")
+        active = self.leases.filter(_active_lease_q()).select_related("content_type").prefetch_related("tenant")
         return [lease.tenant for lease in active]
 
     @property
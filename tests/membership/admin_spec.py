@@ -4,8 +4,9 @@ from decimal import Decimal
 import pytest
 from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client, RequestFactory
-from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
 
 from membership.admin import (
     GuildAdmin,
@@ -27,8 +28,16 @@ from tests.membership.factories import (
     MemberFactory,
     MembershipPlanFactory,
     SpaceFactory,
+    create_leases,
+    create_members,
 )
 
+D100 = Decimal("100.00")
+D200 = Decimal("200.00")
+D250 = Decimal("250.00")
+D300 = Decimal("300.00")
+D400 = Decimal("400.00")
+
 User = get_user_model()
 
 
@@ -146,7 +155,7 @@ def describe_admin_member_computed_fields():
     def it_displays_member_total_monthly_spend():
         plan = MembershipPlanFactory(
             name="Basic Plan",
-            monthly_price=Decimal("100.00"),
+            monthly_price=D100,
         )
         member = MemberFactory(
             full_legal_name="Test User",
@@ -161,10 +170,10 @@ def describe_admin_member_computed_fields():
         result = member_admin.total_monthly_spend_display(annotated_member)
         assert result == "$100.00"
 
-    def it_displays_member_total_monthly_spend_with_leases():
+    def it_displays_member_total_monthly_spend_with_leases(today):
         plan = MembershipPlanFactory(
             name="Lease Spend Plan",
-            monthly_price=Decimal("100.00"),
+            monthly_price=D100,
         )
         member = MemberFactory(
             full_legal_name="Lease Spender",
@@ -173,17 +182,15 @@ def describe_admin_member_computed_fields():
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-SPEND",
             space_type=Space.SpaceType.STUDIO,
             status=Space.Status.OCCUPIED,
         )
-        today = timezone.now().date()
         LeaseFactory(
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("200.00"),
-            monthly_rent=Decimal("200.00"),
+            base_price=D200,
+            monthly_rent=D200,
             start_date=today,
         )
         member_admin = admin.site._registry[Member]
@@ -194,15 +201,10 @@ def describe_admin_member_computed_fields():
         assert result == "$300.00"
 
     def it_displays_member_display_name():
-        plan = MembershipPlanFactory(
-            name="Display Name Plan",
-            monthly_price=Decimal("75.00"),
-        )
         member = MemberFactory(
             full_legal_name="John Smith",
             preferred_name="Johnny",
             email="johnny@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         member_admin = admin.site._registry[Member]
@@ -212,7 +214,7 @@ def describe_admin_member_computed_fields():
     def it_displays_membership_plan_member_count():
         plan = MembershipPlanFactory(
             name="Counted Plan",
-            monthly_price=Decimal("100.00"),
+            monthly_price=D100,
         )
         MemberFactory(
             full_legal_name="Count Member 1",
@@ -238,8 +240,7 @@ def describe_admin_member_computed_fields():
 @pytest.mark.django_db
 def describe_admin_space_computed_fields():
     def it_displays_space_full_price_with_manual_price():
-        space = SpaceFactory(
-            space_id="S-001",
+        space = SpaceFactory.build(
             space_type=Space.SpaceType.STUDIO,
             manual_price=Decimal("500.00"),
             status=Space.Status.AVAILABLE,
@@ -249,10 +250,9 @@ def describe_admin_space_computed_fields():
         assert result == "$500.00"
 
     def it_displays_space_full_price_calculated_from_sqft():
-        space = SpaceFactory(
-            space_id="S-002",
+        space = SpaceFactory.build(
             space_type=Space.SpaceType.STUDIO,
-            size_sqft=Decimal("100.00"),
+            size_sqft=D100,
             status=Space.Status.AVAILABLE,
         )
         space_admin = admin.site._registry[Space]
@@ -260,8 +260,7 @@ def describe_admin_space_computed_fields():
         assert result == "$375.00"
 
     def it_displays_space_full_price_dash_when_none():
-        space = SpaceFactory(
-            space_id="S-003",
+        space = SpaceFactory.build(
             space_type=Space.SpaceType.OTHER,
             status=Space.Status.AVAILABLE,
         )
@@ -269,29 +268,22 @@ def describe_admin_space_computed_fields():
         result = space_admin.full_price_display(space)
         assert result == "-"
 
-    def it_displays_space_actual_revenue():
-        plan = MembershipPlanFactory(
-            name="Revenue Plan",
-            monthly_price=Decimal("50.00"),
-        )
+    def it_displays_space_actual_revenue(today):
         member = MemberFactory(
             full_legal_name="Revenue Member",
             email="revenue@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-020",
             space_type=Space.SpaceType.STUDIO,
             status=Space.Status.OCCUPIED,
         )
-        today = timezone.now().date()
         LeaseFactory(
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("300.00"),
-            monthly_rent=Decimal("300.00"),
+            base_price=D300,
+            monthly_rent=D300,
             start_date=today,
         )
         space_admin = admin.site._registry[Space]
@@ -303,9 +295,8 @@ def describe_admin_space_computed_fields():
 
     def it_displays_space_vacancy_value():
         space = SpaceFactory(
-            space_id="S-021",
             space_type=Space.SpaceType.STUDIO,
-            manual_price=Decimal("400.00"),
+            manual_price=D400,
             status=Space.Status.AVAILABLE,
         )
         space_admin = admin.site._registry[Space]
@@ -317,9 +308,8 @@ def describe_admin_space_computed_fields():
 
     def it_displays_space_vacancy_value_zero_when_occupied():
         space = SpaceFactory(
-            space_id="S-022",
             space_type=Space.SpaceType.STUDIO,
-            manual_price=Decimal("400.00"),
+            manual_price=D400,
             status=Space.Status.OCCUPIED,
         )
         space_admin = admin.site._registry[Space]
@@ -329,30 +319,23 @@ def describe_admin_space_computed_fields():
         result = space_admin.vacancy_value_display(annotated_space)
         assert result == "$0.00"
 
-    def it_displays_vacancy_value_subtracting_active_lease_rent():
-        plan = MembershipPlanFactory(
-            name="Vacancy Subtract Plan",
-            monthly_price=Decimal("50.00"),
-        )
+    def it_displays_vacancy_value_subtracting_active_lease_rent(today):
         member = MemberFactory(
             full_legal_name="Partial Occupant",
             email="partial@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-023",
             space_type=Space.SpaceType.STUDIO,
             manual_price=Decimal("600.00"),
             status=Space.Status.AVAILABLE,
         )
-        today = timezone.now().date()
         LeaseFactory(
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("200.00"),
-            monthly_rent=Decimal("200.00"),
+            base_price=D200,
+            monthly_rent=D200,
             start_date=today,
         )
         space_admin = admin.site._registry[Space]
@@ -366,18 +349,12 @@ def describe_admin_space_computed_fields():
 @pytest.mark.django_db
 def describe_admin_lease_and_inline_fields():
     def it_displays_lease_is_active_for_active_lease():
-        plan = MembershipPlanFactory(
-            name="Active Lease Plan",
-            monthly_price=Decimal("50.00"),
-        )
         member = MemberFactory(
             full_legal_name="Active Member",
             email="active@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-010",
             space_type=Space.SpaceType.STUDIO,
             status=Space.Status.OCCUPIED,
         )
@@ -385,8 +362,8 @@ def describe_admin_lease_and_inline_fields():
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("200.00"),
-            monthly_rent=Decimal("200.00"),
+            base_price=D200,
+            monthly_rent=D200,
             start_date=date(2024, 1, 1),
         )
         lease_admin = admin.site._registry[Lease]
@@ -394,18 +371,12 @@ def describe_admin_lease_and_inline_fields():
         assert result is True
 
     def it_displays_lease_is_active_false_for_expired_lease():
-        plan = MembershipPlanFactory(
-            name="Expired Lease Plan",
-            monthly_price=Decimal("50.00"),
-        )
         member = MemberFactory(
             full_legal_name="Expired Member",
             email="expired@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-011",
             space_type=Space.SpaceType.STORAGE,
             status=Space.Status.AVAILABLE,
         )
@@ -413,8 +384,8 @@ def describe_admin_lease_and_inline_fields():
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.ANNUAL,
-            base_price=Decimal("100.00"),
-            monthly_rent=Decimal("100.00"),
+            base_price=D100,
+            monthly_rent=D100,
             start_date=date(2023, 1, 1),
             end_date=date(2023, 12, 31),
         )
@@ -423,18 +394,12 @@ def describe_admin_lease_and_inline_fields():
         assert result is False
 
     def it_displays_inline_member_is_active():
-        plan = MembershipPlanFactory(
-            name="Inline Member Plan",
-            monthly_price=Decimal("50.00"),
-        )
         member = MemberFactory(
             full_legal_name="Inline Member",
             email="inline-member@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-030",
             space_type=Space.SpaceType.STUDIO,
             status=Space.Status.OCCUPIED,
         )
@@ -442,8 +407,8 @@ def describe_admin_lease_and_inline_fields():
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("200.00"),
-            monthly_rent=Decimal("200.00"),
+            base_price=D200,
+            monthly_rent=D200,
             start_date=date(2024, 1, 1),
         )
         inline = LeaseInlineMember(Member, admin.site)
@@ -451,18 +416,12 @@ def describe_admin_lease_and_inline_fields():
         assert result is True
 
     def it_displays_inline_space_is_active():
-        plan = MembershipPlanFactory(
-            name="Inline Space Plan",
-            monthly_price=Decimal("50.00"),
-        )
         member = MemberFactory(
             full_legal_name="Inline Space Member",
             email="inline-space@example.com",
-            membership_plan=plan,
             join_date=date(2024, 1, 1),
         )
         space = SpaceFactory(
-            space_id="S-031",
             space_type=Space.SpaceType.STUDIO,
             status=Space.Status.OCCUPIED,
         )
@@ -470,8 +429,8 @@ def describe_admin_lease_and_inline_fields():
             tenant_obj=member,
             space=space,
             lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-            base_price=Decimal("250.00"),
-            monthly_rent=Decimal("250.00"),
+            base_price=D250,
+            monthly_rent=D250,
             start_date=date(2024, 1, 1),
         )
         inline = LeaseInlineSpace(Space, admin.site)
@@ -490,24 +449,37 @@ def describe_lease_is_active():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def admin_client():
-    """Return a Django test client logged in as a superuser."""
-    user = User.objects.create_superuser(
-        username="admin-test",
-        password="admin-test-pw",
-        email="admin-test@example.com",
-    )
-    client = Client()
-    client.force_login(user)
+@pytest.fixture(scope="module")
+def admin_client(block_atomic, django_db_blocker):
+    """A Django test client logged in as a superuser, shared by one describe block.
+
+    Like the shared_* fixtures in conftest.py, the user and its session are
+    created inside block_atomic and rolled back when the block ends.
+    """
+    with django_db_blocker.unblock():
+        user = User.objects.create_superuser(
+            username="admin-test",
+            password="admin-test-pw",
+            email="admin-test@example.com",
+        )
+        client = Client()
+        client.force_login(user)
     return client
 
 
+def _changelist_queries(client, url):
+    """GET a changelist and return how many queries rendering it took."""
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(url)
+    assert resp.status_code == 200
+    return len(ctx.captured_queries)
+
+
 @pytest.fixture()
 def sample_plan():
     return MembershipPlanFactory(
         name="View Test Plan",
-        monthly_price=Decimal("100.00"),
+        monthly_price=D100,
     )
 
 
@@ -536,8 +508,8 @@ def sample_lease(sample_member, sample_space):
         tenant_obj=sample_member,
         space=sample_space,
         lease_type=Lease.LeaseType.MONTH_TO_MONTH,
-        base_price=Decimal("300.00"),
-        monthly_rent=Decimal("300.00"),
+        base_price=D300,
+        monthly_rent=D300,
         start_date=date(2024, 6, 1),
     )
 
@@ -676,6 +648,21 @@ def describe_admin_lease_views():
         resp = admin_client.get("/admin/membership/lease/")
         assert resp.status_code == 200
 
+    def it_renders_changelist_in_constant_queries(admin_client, shared_space):
+        member, other_member = create_members({}, {})
+        guild = GuildFactory()
+        create_leases({"tenant_obj": member, "space": shared_space})
+        baseline = _changelist_queries(admin_client, "/admin/membership/lease/")
+
+        create_leases(
+            {"tenant_obj": other_member, "space": shared_space},
+            {"tenant_obj": guild, "space": shared_space},
+            {"tenant_obj": guild, "space": shared_space},
+        )
+        # Tenants are prefetched per type: a first guild adds one query,
+        # further leases add none.
+        assert _changelist_queries(admin_client, "/admin/membership/lease/") == baseline + 1
+
     def it_loads_add_form(admin_client, sample_member, sample_space):
         resp = admin_client.get("/admin/membership/lease/add/")
         assert resp.status_code == 200
@@ -702,7 +689,7 @@ def describe_admin_lease_views():
             },
         )
         assert resp.status_code == 302
-        assert Lease.objects.filter(base_price=Decimal("400.00")).exists()
+        assert Lease.objects.filter(base_price=D400).exists()
 
 
 # ---------------------------------------------------------------------------
@@ -724,6 +711,10 @@ def describe_GuildAdmin():
         guild_admin = admin.site._registry[Guild]
         assert guild_admin.search_fields == ["name"]
 
+    def it_selects_guild_lead_for_the_changelist():
+        guild_admin = admin.site._registry[Guild]
+        assert guild_admin.list_select_related == ["guild_lead"]
+
     def it_has_lease_inline():
         guild_admin = admin.site._registry[Guild]
         assert LeaseInlineGuild in guild_admin.inlines
@@ -763,8 +754,8 @@ def describe_admin_guild_computed_fields():
 
     def it_displays_sublet_count():
         guild = GuildFactory(name="Sublet Count Guild")
-        SpaceFactory(space_id="SC-001", sublet_guild=guild)
-        SpaceFactory(space_id="SC-002", sublet_guild=guild)
+        SpaceFactory(sublet_guild=guild)
+        SpaceFactory(sublet_guild=guild)
         guild_admin = admin.site._registry[Guild]
         rf = RequestFactory()
         request = rf.get("/admin/membership/guild/")
@@ -782,11 +773,9 @@ def describe_admin_guild_computed_fields():
         assert result == 0
 
 
-@pytest.mark.django_db
 def describe_SubletInline():
     def it_displays_full_price_with_manual_price():
-        space = SpaceFactory(
-            space_id="SUB-001",
+        space = SpaceFactory.build(
             manual_price=Decimal("750.00"),
         )
         inline = SubletInline(Guild, admin.site)
@@ -794,17 +783,15 @@ def describe_SubletInline():
         assert result == "$750.00"
 
     def it_displays_full_price_calculated_from_sqft():
-        space = SpaceFactory(
-            space_id="SUB-002",
-            size_sqft=Decimal("200.00"),
+        space = SpaceFactory.build(
+            size_sqft=D200,
         )
         inline = SubletInline(Guild, admin.site)
         result = inline.full_price_display(space)
         assert result == "$750.00"
 
     def it_displays_full_price_dash_when_none():
-        space = SpaceFactory(
-            space_id="SUB-003",
+        space = SpaceFactory.build(
             space_type=Space.SpaceType.OTHER,
         )
         inline = SubletInline(Guild, admin.site)
@@ -852,6 +839,15 @@ def describe_admin_guild_views():
         resp = admin_client.get("/admin/membership/guild/")
         assert resp.status_code == 200
 
+    def it_renders_changelist_in_constant_queries(admin_client):
+        leads = create_members({}, {}, {})
+        GuildFactory(guild_lead=leads[0])
+        baseline = _changelist_queries(admin_client, "/admin/membership/guild/")
+
+        for lead in leads[1:]:
+            GuildFactory(guild_lead=lead)
+        assert _changelist_queries(admin_client, "/admin/membership/guild/") == baseline
+
     def it_loads_add_form(admin_client):
         resp = admin_client.get("/admin/membership/guild/add/")
         assert resp.status_code == 200
@@ -0,0 +1,78 @@
+"""Shared fixtures for the membership specs."""
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+
+from membership.models import Guild, Member
+from tests.membership.factories import MemberFactory, SpaceFactory, create_spaces, default_membership_plan
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Seed the default membership plan and warm the content type cache once per test database.
+
+    Every ``MemberFactory()`` without an explicit plan then reuses the cached plan
+    row instead of inserting a fresh plan or looking one up, and LeaseFactory's
+    ``ContentType.objects.get_for_model(tenant)`` lookups never reach the
+    database. Specs that don't touch the database never trigger this.
+    """
+    with django_db_blocker.unblock():
+        default_membership_plan()
+        ContentType.objects.get_for_models(Guild, Member)
+
+
+@pytest.fixture
+def today():
+    """The date lease activity is judged against, read once per test.
+
+    Matches ``_active_lease_q`` and ``Lease.is_active``, which use the UTC date
+    from ``timezone.now()`` rather than ``timezone.localdate()``. Function scope
+    keeps the equality-boundary specs correct across a midnight rollover.
+    """
+    return timezone.now().date()
+
+
+# Read-only scaffolding. Module scope is per describe block under
+# pytest-describe, so each block gets its own rows. They are created inside
+# block_atomic, outside the per-test transaction, and never committed. Tests
+# using these must not mutate them.
+
+
+@pytest.fixture(scope="module")
+def block_atomic(django_db_setup, django_db_blocker):
+    """Open a transaction around one describe block and roll it back afterwards.
+
+    pytest-django's per-test atomic nests inside it as a savepoint, so rows the
+    shared fixtures create are visible to every spec in the block but never
+    reach the (reused) test database, even if the run is killed mid-block.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+    yield
+    with django_db_blocker.unblock():
+        transaction.set_rollback(True)
+        atomic.__exit__(None, None, None)
+
+
+@pytest.fixture(scope="module")
+def shared_member(block_atomic, django_db_blocker):
+    """A factory-default Member shared by the tests of one describe block."""
+    with django_db_blocker.unblock():
+        return MemberFactory()
+
+
+@pytest.fixture(scope="module")
+def shared_space(block_atomic, django_db_blocker):
+    """A factory-default Space shared by the tests of one describe block."""
+    with django_db_blocker.unblock():
+        return SpaceFactory()
+
+
+@pytest.fixture(scope="module")
+def shared_spaces(block_atomic, django_db_blocker):
+    """Three factory-default Spaces shared by the tests of one describe block."""
+    with django_db_blocker.unblock():
+        return create_spaces({}, {}, {})
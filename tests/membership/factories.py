@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -10,6 +11,11 @@ from django.utils import timezone
 from membership.models import Guild, GuildVote, Lease, Member, MembershipPlan, Space
 
 
+def _days_from_today(days: int) -> date:
+    # Same notion of "today" as _active_lease_q and Lease.is_active.
+    return timezone.now().date() + timedelta(days=days)
+
+
 class MembershipPlanFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = MembershipPlan
@@ -18,11 +24,38 @@ class MembershipPlanFactory(factory.django.DjangoModelFactory):
     monthly_price = Decimal("150.00")
 
 
+@functools.cache
+def default_membership_plan() -> MembershipPlan:
+    """Fetch (or create) the default plan once per process and hand back that instance.
+
+    Members built without an explicit plan point at it without a lookup per
+    member. Treat it as read-only; tests that care about plan fields pass their
+    own plan.
+
+    The cached row is committed once per test database (see the django_db_setup
+    override in tests/membership/conftest.py) and stays valid only because no
+    spec flushes tables; the root conftest.py rejects transactional specs.
+    """
+    plan, _ = MembershipPlan.objects.get_or_create(
+        name="Default Plan",
+        defaults={"monthly_price": Decimal("150.00")},
+    )
+    return plan
+
+
 class MemberFactory(factory.django.DjangoModelFactory):
+    """A saved Member on the shared default plan.
+
+    ``MemberFactory.build()`` is not database-free: without an explicit
+    ``membership_plan`` it calls default_membership_plan(), which queries on a
+    cold cache. Specs that must run without the database build ``Member()``
+    directly or pass a built plan.
+    """
+
     class Meta:
         model = Member
 
-    membership_plan = factory.SubFactory(MembershipPlanFactory)
+    membership_plan = factory.LazyFunction(default_membership_plan)
     full_legal_name = factory.Faker("name")
     email = factory.Sequence(lambda n: f"member{n}@example.com")
     status = Member.Status.ACTIVE
@@ -33,7 +66,9 @@ class SpaceFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Space
 
-    space_id = factory.Sequence(lambda n: f"S-{n:03d}")
+    # Six digits keep generated ids clear of the short hand-written ones
+    # ("S-001", "A-101") that specs asserting on space_id still use.
+    space_id = factory.Sequence(lambda n: f"S-{n:06d}")
     space_type = Space.SpaceType.STUDIO
     status = Space.Status.AVAILABLE
     sublet_guild = None
@@ -56,6 +91,13 @@ class GuildVoteFactory(factory.django.DjangoModelFactory):
 
 
 class LeaseFactory(factory.django.DjangoModelFactory):
+    """A saved month-to-month Lease, by default for a new member and space.
+
+    ``LeaseFactory.build()`` is not database-free either: resolving the
+    tenant's ContentType and the default tenant's plan both query on a cold
+    cache.
+    """
+
     class Meta:
         model = Lease
         exclude = ["tenant_obj"]
@@ -67,4 +109,39 @@ class LeaseFactory(factory.django.DjangoModelFactory):
     lease_type = Lease.LeaseType.MONTH_TO_MONTH
     base_price = Decimal("200.00")
     monthly_rent = Decimal("200.00")
-    start_date = factory.LazyFunction(lambda: timezone.now().date() - timedelta(days=30))
+    start_date = factory.LazyFunction(lambda: _days_from_today(-30))
+
+    class Params:
+        # Lease windows relative to today, for specs that only care whether the
+        # lease counts as active.
+        active = factory.Trait(
+            start_date=factory.LazyFunction(lambda: _days_from_today(-10)),
+            end_date=None,
+        )
+        ended = factory.Trait(
+            start_date=factory.LazyFunction(lambda: _days_from_today(-60)),
+            end_date=factory.LazyFunction(lambda: _days_from_today(-1)),
+        )
+        future = factory.Trait(
+            start_date=factory.LazyFunction(lambda: _days_from_today(30)),
+            end_date=None,
+        )
+
+
+def create_members(*specs):
+    """Insert one Member per spec dict in a single bulk_create, filling factory defaults."""
+    return Member.objects.bulk_create([MemberFactory.build(**spec) for spec in specs])
+
+
+def create_spaces(*specs):
+    """Insert one Space per spec dict in a single bulk_create, filling factory defaults."""
+    return Space.objects.bulk_create([SpaceFactory.build(**spec) for spec in specs])
+
+
+def create_leases(*specs):
+    """Insert one Lease per spec dict in a single bulk_create, filling factory defaults.
+
+    Each spec must pass a saved ``tenant_obj`` and ``space``; built sub-factories
+    would have no primary key to point at.
+    """
+    return Lease.objects.bulk_create([LeaseFactory.build(**spec) for spec in specs])
@@ -5,7 +5,6 @@ from decimal import Decimal
 
 import pytest
 from django.db import IntegrityError
-from django.utils import timezone
 
 from membership.models import Guild, GuildVote, Lease, Member, MembershipPlan, Space
 from tests.membership.factories import (
@@ -13,10 +12,19 @@ from tests.membership.factories import (
     GuildVoteFactory,
     LeaseFactory,
     MemberFactory,
+    MembershipPlanFactory,
     SpaceFactory,
+    create_leases,
 )
 
-pytestmark = pytest.mark.django_db
+D200 = Decimal("200.00")
+D300 = Decimal("300.00")
+D350 = Decimal("350.00")
+D500 = Decimal("500.00")
+D800 = Decimal("800.00")
+
+# Savepoint rollback per test is enough here; nothing needs real transactions.
+pytestmark = pytest.mark.django_db(transaction=False, reset_sequences=False, serialized_rollback=False)
 
 
 # ---------------------------------------------------------------------------
@@ -25,14 +33,12 @@ pytestmark = pytest.mark.django_db
 
 
 def describe_Guild():
-    def it_creates_with_factory():
-        guild = GuildFactory(name="Test Guild")
-        assert guild.name == "Test Guild"
-        assert guild.pk is not None
-
-    def it_has_str_representation():
+    def it_creates_with_unique_name_and_str():
         guild = GuildFactory(name="Ceramics Guild")
+        assert guild.pk is not None
         assert str(guild) == "Ceramics Guild"
+        with pytest.raises(IntegrityError):
+            GuildFactory(name="Ceramics Guild")
 
     def it_can_have_guild_lead():
         member = MemberFactory()
@@ -45,65 +51,57 @@ def describe_Guild():
 
     def it_has_notes_field():
         guild = GuildFactory(name="Notes Guild", notes="Some important notes")
-        guild.refresh_from_db()
-        assert guild.notes == "Some important notes"
+        assert Guild.objects.values_list("notes", flat=True).get(pk=guild.pk) == "Some important notes"
 
     def it_has_created_at():
         guild = GuildFactory()
         assert guild.created_at is not None
 
-    def it_enforces_unique_name():
-        GuildFactory(name="Unique Guild")
-        with pytest.raises(IntegrityError):
-            GuildFactory(name="Unique Guild")
-
 
 def describe_Guild_active_leases():
     def it_returns_active_leases():
         guild = GuildFactory()
-        today = timezone.now().date()
         space = SpaceFactory()
         lease = LeaseFactory(
             tenant_obj=guild,
             space=space,
-            start_date=today - timedelta(days=10),
+            active=True,
         )
-        active = list(guild.active_leases)
-        assert len(active) == 1
-        assert active[0].pk == lease.pk
+        assert list(guild.active_leases.values_list("pk", flat=True)) == [lease.pk]
+
+    def it_loads_the_leased_space_in_the_same_query(django_assert_num_queries):
+        guild = GuildFactory()
+        space = SpaceFactory()
+        LeaseFactory(tenant_obj=guild, space=space, active=True)
+        with django_assert_num_queries(1):
+            assert [lease.space.pk for lease in guild.active_leases] == [space.pk]
 
     def it_excludes_ended_leases():
         guild = GuildFactory()
-        today = timezone.now().date()
         space = SpaceFactory()
         LeaseFactory(
             tenant_obj=guild,
             space=space,
-            start_date=today - timedelta(days=60),
-            end_date=today - timedelta(days=1),
+            ended=True,
         )
-        active = list(guild.active_leases)
-        assert len(active) == 0
+        assert not guild.active_leases.exists()
 
     def it_excludes_future_leases():
         guild = GuildFactory()
-        today = timezone.now().date()
         space = SpaceFactory()
         LeaseFactory(
             tenant_obj=guild,
             space=space,
-            start_date=today + timedelta(days=30),
+            future=True,
         )
-        active = list(guild.active_leases)
-        assert len(active) == 0
+        assert not guild.active_leases.exists()
 
 
 def describe_Guild_ordering():
     def it_orders_by_name():
         g2 = GuildFactory(name="Zebra Guild")
         g1 = GuildFactory(name="Alpha Guild")
-        guilds = list(Guild.objects.all())
-        assert guilds == [g1, g2]
+        assert list(Guild.objects.values_list("pk", flat=True)) == [g1.pk, g2.pk]
 
 
 # ---------------------------------------------------------------------------
@@ -112,18 +110,12 @@ def describe_Guild_ordering():
 
 
 def describe_GuildVote():
-    def it_creates_with_factory():
-        vote = GuildVoteFactory()
-        assert vote.pk is not None
-
-    def it_has_str_representation():
-        vote = GuildVoteFactory(priority=1)
-        assert "\u2192" in str(vote)
-        assert "#1" in str(vote)
-
-    def it_stores_priority():
+    def it_creates_with_priority_and_str():
         vote = GuildVoteFactory(priority=2)
+        assert vote.pk is not None
         assert vote.priority == 2
+        assert "\u2192" in str(vote)
+        assert "#2" in str(vote)
 
     def it_references_member_and_guild():
         member = MemberFactory()
@@ -150,8 +142,8 @@ def describe_GuildVote():
             guild_b = GuildFactory(name="Guild B")
             v2 = GuildVoteFactory(member=member, guild=guild_b, priority=2)
             v1 = GuildVoteFactory(member=member, guild=guild_a, priority=1)
-            votes = list(GuildVote.objects.filter(member=member))
-            assert votes == [v1, v2]
+            votes = GuildVote.objects.filter(member=member).values_list("pk", flat=True)
+            assert list(votes) == [v1.pk, v2.pk]
 
 
 # ---------------------------------------------------------------------------
@@ -160,10 +152,9 @@ def describe_GuildVote():
 
 
 def describe_lease_with_guild_tenant():
-    def it_creates_lease_for_guild():
+    def it_creates_lease_for_guild(today):
         guild = GuildFactory(name="Pottery Guild")
         space = SpaceFactory()
-        today = timezone.now().date()
         lease = LeaseFactory(
             tenant_obj=guild,
             space=space,
@@ -173,19 +164,16 @@ def describe_lease_with_guild_tenant():
         assert lease.pk is not None
 
     def it_has_str_representation_with_guild():
-        guild = GuildFactory(name="Woodworking")
-        space = SpaceFactory(space_id="W-100", name="Workshop")
-        lease = LeaseFactory(
-            tenant_obj=guild,
-            space=space,
+        lease = Lease(
+            tenant=Guild(name="Woodworking"),
+            space=Space(space_id="W-100", name="Workshop"),
             start_date=date(2024, 6, 1),
         )
         assert str(lease) == "Woodworking @ W-100 - Workshop (2024-06-01)"
 
-    def it_appears_in_space_current_occupants():
+    def it_appears_in_space_current_occupants(today):
         guild = GuildFactory(name="Current Occupant Guild")
         space = SpaceFactory()
-        today = timezone.now().date()
         LeaseFactory(
             tenant_obj=guild,
             space=space,
@@ -195,40 +183,41 @@ def describe_lease_with_guild_tenant():
         assert len(occupants) == 1
         assert occupants[0] == guild
 
-    def it_mixes_member_and_guild_occupants():
+    def it_mixes_member_and_guild_occupants(django_assert_max_num_queries, today):
         member = MemberFactory()
         guild = GuildFactory()
         space = SpaceFactory()
-        today = timezone.now().date()
-        LeaseFactory(
-            tenant_obj=member,
-            space=space,
-            start_date=today - timedelta(days=10),
-            monthly_rent=Decimal("200.00"),
+        create_leases(
+            {
+                "tenant_obj": member,
+                "space": space,
+                "active": True,
+                "monthly_rent": D200,
+            },
+            {
+                "tenant_obj": guild,
+                "space": space,
+                "start_date": today - timedelta(days=5),
+                "monthly_rent": D300,
+            },
         )
-        LeaseFactory(
-            tenant_obj=guild,
-            space=space,
-            start_date=today - timedelta(days=5),
-            monthly_rent=Decimal("300.00"),
-        )
-        occupants = space.current_occupants
+        # Leases, then one query per tenant type.
+        with django_assert_max_num_queries(3):
+            occupants = space.current_occupants
         assert len(occupants) == 2
-        occupant_types = {type(o) for o in occupants}
-        assert Member in occupant_types
-        assert Guild in occupant_types
+        assert any(isinstance(o, Member) for o in occupants)
+        assert any(isinstance(o, Guild) for o in occupants)
 
-    def it_calculates_space_revenue_with_guild_lease():
+    def it_calculates_space_revenue_with_guild_lease(today):
         guild = GuildFactory()
-        space = SpaceFactory(manual_price=Decimal("800.00"))
-        today = timezone.now().date()
+        space = SpaceFactory(manual_price=D800)
         LeaseFactory(
             tenant_obj=guild,
             space=space,
-            monthly_rent=Decimal("500.00"),
+            monthly_rent=D500,
             start_date=today - timedelta(days=5),
         )
-        assert space.actual_revenue == Decimal("500.00")
+        assert space.actual_revenue == D500
 
 
 # ---------------------------------------------------------------------------
@@ -237,8 +226,10 @@ def describe_lease_with_guild_tenant():
 
 
 def describe_fixture_loading():
-    def it_loads_initial_data(tmp_path):
+    def it_loads_initial_data(monkeypatch):
         """Create synthetic objects, serialize to fixture, flush, reload, and verify."""
+        import io
+
         from django.core import serializers
         from django.core.management import call_command
 
@@ -247,13 +238,13 @@ def describe_fixture_loading():
         guild_b = GuildFactory(name="Glass Guild")
         space_a = SpaceFactory(space_id="A-100", name="Studio A", sublet_guild=guild_a)
         space_b = SpaceFactory(space_id="B-200", name="Workshop B")
-        member = MemberFactory(full_legal_name="Fixture Test Member")
-        today = timezone.now().date()
+        # Its own plan: the flush below must not touch the shared default plan.
+        member = MemberFactory(full_legal_name="Fixture Test Member", membership_plan=MembershipPlanFactory())
         lease = LeaseFactory(
             tenant_obj=guild_a,
             space=space_a,
-            start_date=today - timedelta(days=10),
-            monthly_rent=Decimal("350.00"),
+            active=True,
+            monthly_rent=D350,
         )
 
         # Collect PKs before flush
@@ -272,9 +263,7 @@ def describe_fixture_loading():
         objects += list(Space.objects.filter(pk__in=[space_a_pk, space_b_pk]))
         objects += list(Lease.objects.filter(pk=lease_pk))
 
-        fixture_json = serializers.serialize("json", objects, indent=2)
-        fixture_path = tmp_path / "test_fixture.json"
-        fixture_path.write_text(fixture_json)
+        fixture_json = serializers.serialize("json", objects)
 
         # 3. Delete all created objects (order matters for FK constraints)
         Lease.objects.filter(pk=lease_pk).delete()
@@ -284,13 +273,14 @@ def describe_fixture_loading():
         MembershipPlan.objects.filter(pk=plan_pk).delete()
 
         # Verify they are gone
-        assert Guild.objects.filter(pk=guild_a_pk).count() == 0
-        assert Space.objects.filter(pk=space_a_pk).count() == 0
-        assert Member.objects.filter(pk=member_pk).count() == 0
-        assert Lease.objects.filter(pk=lease_pk).count() == 0
+        assert not Guild.objects.filter(pk=guild_a_pk).exists()
+        assert not Space.objects.filter(pk=space_a_pk).exists()
+        assert not Member.objects.filter(pk=member_pk).exists()
+        assert not Lease.objects.filter(pk=lease_pk).exists()
 
-        # 4. Load the fixture
-        call_command("loaddata", str(fixture_path), verbosity=0)
+        # 4. Load the fixture straight from memory via loaddata's stdin mode
+        monkeypatch.setattr("sys.stdin", io.StringIO(fixture_json))
+        call_command("loaddata", "-", format="json", verbosity=0)
 
         # 5. Verify objects were loaded correctly
         loaded_guild_a = Guild.objects.get(pk=guild_a_pk)
@@ -311,7 +301,7 @@ def describe_fixture_loading():
         assert loaded_member.full_legal_name == "Fixture Test Member"
 
         loaded_lease = Lease.objects.get(pk=lease_pk)
-        assert loaded_lease.monthly_rent == Decimal("350.00")
+        assert loaded_lease.monthly_rent == D350
         assert loaded_lease.space_id == space_a_pk
         assert loaded_lease.tenant == loaded_guild_a
 
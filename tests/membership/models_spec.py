@@ -4,32 +4,49 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
-from django.utils import timezone
 
-from membership.models import DEFAULT_PRICE_PER_SQFT, Lease, Member, Space
+from membership.models import DEFAULT_PRICE_PER_SQFT, Lease, Member, MembershipPlan, Space
 from tests.membership.factories import (
     GuildFactory,
     LeaseFactory,
     MemberFactory,
     MembershipPlanFactory,
     SpaceFactory,
+    create_leases,
+    create_members,
+    create_spaces,
 )
 
+D0 = Decimal("0.00")
+D100 = Decimal("100.00")
+D150 = Decimal("150.00")
+D200 = Decimal("200.00")
+D250 = Decimal("250.00")
+D300 = Decimal("300.00")
+D350 = Decimal("350.00")
+D400 = Decimal("400.00")
+D450 = Decimal("450.00")
+D500 = Decimal("500.00")
+D600 = Decimal("600.00")
+
+
 # ---------------------------------------------------------------------------
 # MembershipPlan
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.django_db
 def describe_membership_plan():
     def it_has_str_representation():
-        plan = MembershipPlanFactory(name="Premium Studio")
+        plan = MembershipPlanFactory.build(name="Premium Studio")
         assert str(plan) == "Premium Studio"
 
+
+@pytest.mark.django_db
+def describe_membership_plan_storage():
     def it_stores_monthly_price():
         plan = MembershipPlanFactory(monthly_price=Decimal("275.50"))
-        plan.refresh_from_db()
-        assert plan.monthly_price == Decimal("275.50")
+        stored = MembershipPlan.objects.values_list("monthly_price", flat=True).get(pk=plan.pk)
+        assert stored == Decimal("275.50")
 
     def it_allows_nullable_deposit():
         plan_no_deposit = MembershipPlanFactory(name="No Deposit Plan")
@@ -37,10 +54,10 @@ def describe_membership_plan():
 
         plan_with_deposit = MembershipPlanFactory(
             name="With Deposit Plan",
-            deposit_required=Decimal("500.00"),
+            deposit_required=D500,
         )
-        plan_with_deposit.refresh_from_db()
-        assert plan_with_deposit.deposit_required == Decimal("500.00")
+        stored = MembershipPlan.objects.values_list("deposit_required", flat=True).get(pk=plan_with_deposit.pk)
+        assert stored == D500
 
 
 # ---------------------------------------------------------------------------
@@ -48,175 +65,156 @@ def describe_membership_plan():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.django_db
 def describe_member():
+    # Plain Member() rather than MemberFactory.build(): the factory's default
+    # plan is a saved row, and these specs run without the test database.
+
     def it_has_str_representation():
-        member = MemberFactory(preferred_name="JD")
+        member = Member(preferred_name="JD")
         assert str(member) == "JD"
 
     def describe_display_name():
         def it_returns_preferred_name_when_set():
-            member = MemberFactory(
-                full_legal_name="Jane Doe",
-                preferred_name="JD",
-            )
+            member = Member(full_legal_name="Jane Doe", preferred_name="JD")
             assert member.display_name == "JD"
 
         def it_returns_full_legal_name_when_no_preferred_name():
-            member = MemberFactory(
-                full_legal_name="Jane Doe",
-                preferred_name="",
-            )
+            member = Member(full_legal_name="Jane Doe", preferred_name="")
             assert member.display_name == "Jane Doe"
 
-    def it_defaults_to_active_status():
-        member = MemberFactory()
-        assert member.status == Member.Status.ACTIVE
+    def it_allows_null_user():
+        assert Member._meta.get_field("user").null is True
 
-    def it_defaults_to_standard_role():
-        member = MemberFactory()
-        assert member.role == Member.Role.STANDARD
+    def it_allows_null_committed_until():
+        assert Member._meta.get_field("committed_until").null is True
 
-    def it_allows_null_user():
-        member = MemberFactory(user=None)
-        assert member.user is None
+
+@pytest.mark.django_db
+def describe_member_defaults():
+    def it_defaults_to_active_status(shared_member):
+        assert shared_member.status == Member.Status.ACTIVE
+
+    def it_defaults_to_standard_role(shared_member):
+        assert shared_member.role == Member.Role.STANDARD
 
     def it_stores_committed_until():
         member = MemberFactory(committed_until=date(2025, 6, 30))
-        member.refresh_from_db()
-        assert member.committed_until == date(2025, 6, 30)
-
-    def it_allows_null_committed_until():
-        member = MemberFactory()
-        assert member.committed_until is None
+        stored = Member.objects.values_list("committed_until", flat=True).get(pk=member.pk)
+        assert stored == date(2025, 6, 30)
 
 
 @pytest.mark.django_db
 def describe_member_optional_fields():
-    def it_allows_blank_email():
-        member = MemberFactory(email="")
-        assert member.email == ""
-
-    def it_allows_null_join_date():
-        member = MemberFactory(join_date=None)
-        assert member.join_date is None
-
-    def it_stores_billing_name():
-        member = MemberFactory(billing_name="Test Billing")
-        assert member.billing_name == "Test Billing"
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            pytest.param("email", "", id="blank_email"),
+            pytest.param("join_date", None, id="null_join_date"),
+            pytest.param("billing_name", "Test Billing", id="billing_name"),
+        ],
+    )
+    def it_stores_the_value(field, value):
+        member = MemberFactory(**{field: value})
+        assert Member.objects.values_list(field, flat=True).get(pk=member.pk) == value
 
 
 @pytest.mark.django_db
 def describe_member_computed_properties():
+    # The member and space are shared by the block; each spec only adds the
+    # leases it needs, and those roll back with the spec.
+
     def it_calculates_membership_monthly_dues():
-        plan = MembershipPlanFactory(monthly_price=Decimal("250.00"))
-        member = MemberFactory(membership_plan=plan)
-        assert member.membership_monthly_dues == Decimal("250.00")
+        member = MemberFactory.build(membership_plan=MembershipPlanFactory.build(monthly_price=D250))
+        assert member.membership_monthly_dues == D250
+
+    def it_calculates_studio_storage_total_with_active_leases(
+        shared_member, shared_space, django_assert_num_queries, today
+    ):
+        create_leases(
+            {"tenant_obj": shared_member, "space": shared_space, "monthly_rent": D300, "active": True},
+            {
+                "tenant_obj": shared_member,
+                "space": shared_space,
+                "monthly_rent": D150,
+                "start_date": today - timedelta(days=5),
+            },
+        )
 
-    def it_calculates_studio_storage_total_with_active_leases():
-        plan = MembershipPlanFactory(monthly_price=Decimal("150.00"))
-        member = MemberFactory(membership_plan=plan)
-        today = timezone.now().date()
+        with django_assert_num_queries(1):
+            assert shared_member.studio_storage_total == D450
 
-        space_a = SpaceFactory(space_id="S-A")
-        space_b = SpaceFactory(space_id="S-B")
+    def it_returns_zero_studio_storage_with_no_leases(shared_member):
+        assert shared_member.studio_storage_total == D0
 
-        LeaseFactory(
-            tenant_obj=member,
-            space=space_a,
-            monthly_rent=Decimal("300.00"),
-            start_date=today - timedelta(days=10),
-        )
-        LeaseFactory(
-            tenant_obj=member,
-            space=space_b,
-            monthly_rent=Decimal("150.00"),
-            start_date=today - timedelta(days=5),
+    def it_calculates_total_monthly_spend(shared_member, shared_space, django_assert_num_queries):
+        LeaseFactory(tenant_obj=shared_member, space=shared_space, monthly_rent=D100, active=True)
+
+        # Dues come from the already-loaded plan; only the lease sum hits the DB.
+        with django_assert_num_queries(1):
+            assert shared_member.total_monthly_spend == D250  # default plan 150.00 + lease 100.00
+
+
+@pytest.mark.django_db
+def describe_member_active_leases():
+    def it_returns_active_leases(shared_spaces, django_assert_num_queries, today):
+        member = MemberFactory()
+
+        space_active, space_ended, space_future = shared_spaces
+        active_lease, _, _ = create_leases(
+            {
+                "tenant_obj": member,
+                "space": space_active,
+                "start_date": today - timedelta(days=30),
+            },
+            {
+                "tenant_obj": member,
+                "space": space_ended,
+                "ended": True,
+            },
+            {
+                "tenant_obj": member,
+                "space": space_future,
+                "future": True,
+            },
         )
 
-        assert member.studio_storage_total == Decimal("450.00")
+        with django_assert_num_queries(1):
+            active_pks = list(member.active_leases.values_list("pk", flat=True))
+        assert active_pks == [active_lease.pk]
 
-    def it_returns_zero_studio_storage_with_no_leases():
+    def it_loads_the_leased_space_in_the_same_query(shared_spaces, django_assert_num_queries):
         member = MemberFactory()
-        assert member.studio_storage_total == Decimal("0.00")
+        create_leases(*({"tenant_obj": member, "space": space, "active": True} for space in shared_spaces))
 
-    def it_calculates_total_monthly_spend():
-        plan = MembershipPlanFactory(monthly_price=Decimal("200.00"))
-        member = MemberFactory(membership_plan=plan)
-        today = timezone.now().date()
+        with django_assert_num_queries(1):
+            leased = {lease.space.pk for lease in member.active_leases}
+        assert leased == {space.pk for space in shared_spaces}
 
-        space = SpaceFactory(space_id="S-TMS")
-        LeaseFactory(
+    def it_includes_ongoing_lease_with_no_end_date(shared_spaces, today):
+        member = MemberFactory()
+        ongoing = LeaseFactory(
             tenant_obj=member,
-            space=space,
-            monthly_rent=Decimal("100.00"),
+            space=shared_spaces[0],
             start_date=today - timedelta(days=10),
+            end_date=None,
         )
-
-        assert member.total_monthly_spend == Decimal("300.00")
+        assert list(member.active_leases.values_list("pk", flat=True)) == [ongoing.pk]
 
 
 @pytest.mark.django_db
-def describe_member_leases_and_spaces():
-    def describe_active_leases():
-        def it_returns_active_leases():
-            member = MemberFactory()
-            today = timezone.now().date()
-
-            space_active = SpaceFactory(space_id="S-ACT")
-            space_ended = SpaceFactory(space_id="S-END")
-            space_future = SpaceFactory(space_id="S-FUT")
-
-            active_lease = LeaseFactory(
-                tenant_obj=member,
-                space=space_active,
-                start_date=today - timedelta(days=30),
-            )
-            LeaseFactory(
-                tenant_obj=member,
-                space=space_ended,
-                start_date=today - timedelta(days=60),
-                end_date=today - timedelta(days=1),
-            )
-            LeaseFactory(
-                tenant_obj=member,
-                space=space_future,
-                start_date=today + timedelta(days=30),
-            )
-
-            active = list(member.active_leases)
-            assert len(active) == 1
-            assert active[0].pk == active_lease.pk
-
-        def it_includes_ongoing_lease_with_no_end_date():
-            member = MemberFactory()
-            today = timezone.now().date()
-            space = SpaceFactory(space_id="S-ONG")
-            ongoing = LeaseFactory(
-                tenant_obj=member,
-                space=space,
-                start_date=today - timedelta(days=10),
-                end_date=None,
-            )
-            active = list(member.active_leases)
-            assert len(active) == 1
-            assert active[0].pk == ongoing.pk
-
-    def describe_current_spaces():
-        def it_returns_current_spaces():
-            member = MemberFactory()
-            today = timezone.now().date()
-
-            space = SpaceFactory(space_id="S-CUR")
-            LeaseFactory(
-                tenant_obj=member,
-                space=space,
-                start_date=today - timedelta(days=10),
-            )
-
-            spaces = list(member.current_spaces)
-            assert len(spaces) == 1
-            assert spaces[0].pk == space.pk
+def describe_member_current_spaces():
+    def it_returns_current_spaces(shared_space, django_assert_num_queries):
+        member = MemberFactory()
+        LeaseFactory(
+            tenant_obj=member,
+            space=shared_space,
+            active=True,
+        )
+
+        # The active-lease filter is inlined as a subquery: one round-trip.
+        with django_assert_num_queries(1):
+            space_pks = list(member.current_spaces.values_list("pk", flat=True))
+        assert space_pks == [shared_space.pk]
 
 
 # ---------------------------------------------------------------------------
@@ -224,290 +222,210 @@ def describe_member_leases_and_spaces():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.django_db
 def describe_space():
     def it_has_str_representation():
-        space = SpaceFactory(space_id="A-101", name="Corner Studio")
+        space = Space(space_id="A-101", name="Corner Studio")
         assert str(space) == "A-101 - Corner Studio"
 
     def it_has_str_representation_without_name():
-        space = SpaceFactory(space_id="A-102", name="")
+        space = Space(space_id="A-102", name="")
         assert str(space) == "A-102"
 
-    def describe_full_price():
-        def it_uses_manual_price_when_set():
-            space = SpaceFactory(
-                space_id="S-MP",
-                manual_price=Decimal("500.00"),
-                size_sqft=Decimal("100.00"),
-            )
-            assert space.full_price == Decimal("500.00")
-
-        def it_calculates_from_sqft_when_no_manual_price():
-            space = SpaceFactory(
-                space_id="S-SQ",
-                manual_price=None,
-                size_sqft=Decimal("100.00"),
-            )
-            expected = Decimal("100.00") * DEFAULT_PRICE_PER_SQFT
-            assert space.full_price == expected
-
-        def it_returns_none_when_no_size_or_manual_price():
-            space = SpaceFactory(
-                space_id="S-NO",
-                manual_price=None,
-                size_sqft=None,
-            )
-            assert space.full_price is None
-
-        def it_uses_default_rate_when_rate_per_sqft_is_none():
-            space = SpaceFactory(size_sqft=Decimal("100"), rate_per_sqft=None)
-            assert space.full_price == Decimal("375.00")  # 100 * 3.75
-
-        def it_uses_custom_rate_per_sqft_when_set():
-            space = SpaceFactory(size_sqft=Decimal("100"), rate_per_sqft=Decimal("4.00"))
-            assert space.full_price == Decimal("400.00")  # 100 * 4.00
-
-        def it_prefers_manual_price_over_rate_per_sqft():
-            space = SpaceFactory(
-                size_sqft=Decimal("100"),
-                rate_per_sqft=Decimal("4.00"),
-                manual_price=Decimal("500.00"),
-            )
-            assert space.full_price == Decimal("500.00")
+
+def describe_space_full_price():
+    """full_price only reads the instance's own fields, so unsaved spaces cover it."""
+
+    @pytest.mark.parametrize(
+        "manual_price, size_sqft, rate_per_sqft, expected",
+        [
+            pytest.param(D500, D100, None, D500, id="manual_price_when_set"),
+            pytest.param(None, D100, None, D100 * DEFAULT_PRICE_PER_SQFT, id="sqft_when_no_manual_price"),
+            pytest.param(None, None, None, None, id="none_without_size_or_manual_price"),
+            pytest.param(None, Decimal("100"), None, Decimal("375.00"), id="default_rate_when_rate_is_none"),
+            pytest.param(None, Decimal("100"), Decimal("4.00"), D400, id="custom_rate_per_sqft"),
+            pytest.param(D500, Decimal("100"), Decimal("4.00"), D500, id="manual_price_over_rate_per_sqft"),
+        ],
+    )
+    def it_prices_the_space(manual_price, size_sqft, rate_per_sqft, expected):
+        space = Space(manual_price=manual_price, size_sqft=size_sqft, rate_per_sqft=rate_per_sqft)
+        assert space.full_price == expected
 
 
 @pytest.mark.django_db
 def describe_space_is_rentable():
-    def it_defaults_to_true():
-        space = SpaceFactory()
-        assert space.is_rentable is True
+    def it_defaults_to_true(shared_space):
+        assert shared_space.is_rentable is True
 
     def it_can_be_set_to_false():
         space = SpaceFactory(is_rentable=False)
         assert space.is_rentable is False
 
 
-@pytest.mark.django_db
 def describe_space_vacancy_value():
     def it_returns_full_price_when_available():
-        space = SpaceFactory(
-            space_id="S-VA",
-            status=Space.Status.AVAILABLE,
-            manual_price=Decimal("400.00"),
-        )
-        assert space.vacancy_value == Decimal("400.00")
+        space = Space(status=Space.Status.AVAILABLE, manual_price=D400)
+        assert space.vacancy_value == D400
 
     def it_returns_zero_when_occupied():
-        space = SpaceFactory(
-            space_id="S-OC",
-            status=Space.Status.OCCUPIED,
-            manual_price=Decimal("400.00"),
-        )
-        assert space.vacancy_value == Decimal("0.00")
+        space = Space(status=Space.Status.OCCUPIED, manual_price=D400)
+        assert space.vacancy_value == D0
 
     def it_returns_zero_when_available_but_no_price():
-        space = SpaceFactory(
-            space_id="S-NP",
-            status=Space.Status.AVAILABLE,
-            manual_price=None,
-            size_sqft=None,
-        )
-        assert space.vacancy_value == Decimal("0.00")
+        space = Space(status=Space.Status.AVAILABLE, manual_price=None, size_sqft=None)
+        assert space.vacancy_value == D0
 
 
 @pytest.mark.django_db
-def describe_space_occupants_and_revenue():
-    def describe_current_occupants():
-        def it_returns_current_occupants():
-            plan = MembershipPlanFactory(name="Occ Plan")
-            member = MemberFactory(membership_plan=plan)
-            today = timezone.now().date()
-            space = SpaceFactory(space_id="S-OCC")
-
-            LeaseFactory(
-                tenant_obj=member,
-                space=space,
-                start_date=today - timedelta(days=10),
-            )
+def describe_space_current_occupants():
+    def it_returns_current_occupants(django_assert_num_queries):
+        member = MemberFactory()
+        space = SpaceFactory()
 
-            occupants = list(space.current_occupants)
-            assert len(occupants) == 1
-            assert occupants[0].pk == member.pk
-
-        def it_excludes_ended_leases():
-            plan = MembershipPlanFactory(name="Occ Plan 2")
-            member = MemberFactory(membership_plan=plan)
-            today = timezone.now().date()
-            space = SpaceFactory(space_id="S-OC2")
-
-            LeaseFactory(
-                tenant_obj=member,
-                space=space,
-                start_date=today - timedelta(days=60),
-                end_date=today - timedelta(days=1),
-            )
+        LeaseFactory(
+            tenant_obj=member,
+            space=space,
+            active=True,
+        )
 
+        # One query for the leases, one per tenant type fetched through the generic FK.
+        with django_assert_num_queries(2):
             occupants = list(space.current_occupants)
-            assert len(occupants) == 0
-
-    def describe_revenue():
-        def it_calculates_actual_revenue_from_active_leases():
-            plan = MembershipPlanFactory(name="Rev Plan")
-            member_a = MemberFactory(membership_plan=plan, full_legal_name="Alice", email="alice@example.com")
-            member_b = MemberFactory(membership_plan=plan, full_legal_name="Bob", email="bob@example.com")
-            today = timezone.now().date()
-            space = SpaceFactory(space_id="S-REV", manual_price=Decimal("600.00"))
-
-            LeaseFactory(
-                tenant_obj=member_a,
-                space=space,
-                monthly_rent=Decimal("300.00"),
-                start_date=today - timedelta(days=10),
-            )
-            LeaseFactory(
-                tenant_obj=member_b,
-                space=space,
-                monthly_rent=Decimal("200.00"),
-                start_date=today - timedelta(days=5),
-            )
-
-            assert space.actual_revenue == Decimal("500.00")
-
-        def it_returns_zero_revenue_with_no_active_leases():
-            space = SpaceFactory(space_id="S-NR")
-            assert space.actual_revenue == Decimal("0.00")
-
-        def it_calculates_revenue_loss():
-            space = SpaceFactory(
-                space_id="S-RL",
-                manual_price=Decimal("600.00"),
-            )
-            plan = MembershipPlanFactory(name="RL Plan")
-            member = MemberFactory(membership_plan=plan, email="rl@example.com")
-            today = timezone.now().date()
-
-            LeaseFactory(
-                tenant_obj=member,
-                space=space,
-                monthly_rent=Decimal("400.00"),
-                start_date=today - timedelta(days=5),
-            )
-
-            assert space.revenue_loss == Decimal("200.00")
-
-        def it_returns_none_revenue_loss_when_no_full_price():
-            space = SpaceFactory(
-                space_id="S-NRL",
-                manual_price=None,
-                size_sqft=None,
-            )
-            assert space.revenue_loss is None
+        assert len(occupants) == 1
+        assert occupants[0].pk == member.pk
 
+    def it_loads_tenants_of_one_type_in_a_single_query(django_assert_num_queries):
+        members = create_members({}, {}, {})
+        space = SpaceFactory()
+        create_leases(*({"tenant_obj": member, "space": space, "active": True} for member in members))
 
-# ---------------------------------------------------------------------------
-# Lease
-# ---------------------------------------------------------------------------
+        with django_assert_num_queries(2):
+            occupants = space.current_occupants
+        assert {o.pk for o in occupants} == {m.pk for m in members}
 
+    def it_excludes_ended_leases():
+        member = MemberFactory()
+        space = SpaceFactory()
 
-@pytest.mark.django_db
-def describe_lease():
-    def it_has_str_representation():
-        plan = MembershipPlanFactory(name="Lease Plan")
-        member = MemberFactory(
-            membership_plan=plan,
-            full_legal_name="Test User",
-            preferred_name="TU",
-            email="tu@example.com",
-        )
-        space = SpaceFactory(space_id="L-100", name="Main")
-        lease = LeaseFactory(
+        LeaseFactory(
             tenant_obj=member,
             space=space,
-            start_date=date(2024, 3, 1),
+            ended=True,
         )
-        assert str(lease) == "TU @ L-100 - Main (2024-03-01)"
 
-    def it_stores_committed_until():
-        lease = LeaseFactory(committed_until=date(2025, 12, 31))
-        lease.refresh_from_db()
-        assert lease.committed_until == date(2025, 12, 31)
+        assert space.current_occupants == []
 
-    def it_allows_null_committed_until():
-        lease = LeaseFactory()
-        assert lease.committed_until is None
 
-    def describe_new_fields():
-        def it_stores_discount_reason():
-            lease = LeaseFactory(discount_reason="Annual discount 10%")
-            assert lease.discount_reason == "Annual discount 10%"
+@pytest.mark.django_db
+def describe_space_revenue():
+    def it_calculates_actual_revenue_from_active_leases(django_assert_num_queries, today):
+        member_a, member_b = create_members(
+            {"full_legal_name": "Alice", "email": "alice@example.com"},
+            {"full_legal_name": "Bob", "email": "bob@example.com"},
+        )
+        space = SpaceFactory(manual_price=D600)
+
+        create_leases(
+            {
+                "tenant_obj": member_a,
+                "space": space,
+                "monthly_rent": D300,
+                "active": True,
+            },
+            {
+                "tenant_obj": member_b,
+                "space": space,
+                "monthly_rent": D200,
+                "start_date": today - timedelta(days=5),
+            },
+        )
 
-        def it_stores_is_split():
-            lease = LeaseFactory(is_split=True)
-            assert lease.is_split is True
+        with django_assert_num_queries(1):
+            assert space.actual_revenue == D500
 
-        def it_defaults_is_split_to_false():
-            lease = LeaseFactory()
-            assert lease.is_split is False
+    def it_returns_zero_revenue_with_no_active_leases():
+        space = SpaceFactory()
+        assert space.actual_revenue == D0
 
-        def it_stores_prepaid_through():
-            lease = LeaseFactory(prepaid_through=date(2025, 12, 31))
-            assert lease.prepaid_through == date(2025, 12, 31)
+    def it_calculates_revenue_loss(today):
+        space = SpaceFactory(
+            manual_price=D600,
+        )
+        member = MemberFactory(email="rl@example.com")
 
-        def it_allows_null_prepaid_through():
-            lease = LeaseFactory()
-            assert lease.prepaid_through is None
+        LeaseFactory(
+            tenant_obj=member,
+            space=space,
+            monthly_rent=D400,
+            start_date=today - timedelta(days=5),
+        )
 
+        assert space.revenue_loss == D200
 
-@pytest.mark.django_db
-def describe_lease_is_active():
-    def it_is_active_when_ongoing():
-        """Ongoing lease: started in the past, no end_date."""
-        today = timezone.now().date()
-        lease = LeaseFactory(
-            start_date=today - timedelta(days=30),
-            end_date=None,
+    def it_returns_none_revenue_loss_when_no_full_price():
+        space = SpaceFactory(
+            manual_price=None,
+            size_sqft=None,
         )
-        assert lease.is_active is True
+        assert space.revenue_loss is None
 
-    def it_is_active_when_within_date_range():
-        today = timezone.now().date()
-        lease = LeaseFactory(
-            start_date=today - timedelta(days=30),
-            end_date=today + timedelta(days=30),
-        )
-        assert lease.is_active is True
 
-    def it_is_active_when_end_date_is_today():
-        today = timezone.now().date()
-        lease = LeaseFactory(
-            start_date=today - timedelta(days=30),
-            end_date=today,
-        )
-        assert lease.is_active is True
+# ---------------------------------------------------------------------------
+# Lease
+# ---------------------------------------------------------------------------
 
-    def it_is_active_when_start_date_is_today():
-        today = timezone.now().date()
-        lease = LeaseFactory(
-            start_date=today,
-            end_date=None,
+
+@pytest.mark.django_db
+def describe_lease():
+    def it_has_str_representation():
+        # Assigning the generic tenant resolves its ContentType, which is a
+        # cached lookup but still needs the database on a cold cache.
+        lease = Lease(
+            tenant=Member(full_legal_name="Test User", preferred_name="TU"),
+            space=Space(space_id="L-100", name="Main"),
+            start_date=date(2024, 3, 1),
         )
-        assert lease.is_active is True
+        assert str(lease) == "TU @ L-100 - Main (2024-03-01)"
 
-    def it_is_not_active_when_ended():
-        today = timezone.now().date()
+    def it_round_trips_lease_fields():
         lease = LeaseFactory(
-            start_date=today - timedelta(days=60),
-            end_date=today - timedelta(days=1),
+            discount_reason="Annual discount 10%",
+            is_split=True,
+            prepaid_through=date(2025, 12, 31),
+            committed_until=date(2025, 12, 31),
         )
-        assert lease.is_active is False
+        stored = Lease.objects.values_list("discount_reason", "is_split", "prepaid_through", "committed_until").get(
+            pk=lease.pk
+        )
+        assert stored == ("Annual discount 10%", True, date(2025, 12, 31), date(2025, 12, 31))
 
-    def it_is_not_active_when_not_started():
-        today = timezone.now().date()
-        lease = LeaseFactory(
-            start_date=today + timedelta(days=1),
+
+def describe_lease_defaults():
+    def it_defaults_is_split_and_allows_null_dates():
+        assert Lease().is_split is False
+        assert Lease._meta.get_field("committed_until").null is True
+        assert Lease._meta.get_field("prepaid_through").null is True
+
+
+def describe_lease_is_active():
+    """is_active is a pure date check, so in-memory leases cover it without the DB."""
+
+    @pytest.mark.parametrize(
+        "start_offset, end_offset, expected",
+        [
+            pytest.param(-30, None, True, id="ongoing"),
+            pytest.param(-30, 30, True, id="within_date_range"),
+            pytest.param(-30, 0, True, id="end_date_is_today"),
+            pytest.param(0, None, True, id="start_date_is_today"),
+            pytest.param(-60, -1, False, id="ended"),
+            pytest.param(1, None, False, id="not_started"),
+        ],
+    )
+    def it_reflects_the_lease_dates(today, start_offset, end_offset, expected):
+        lease = Lease(
+            start_date=today + timedelta(days=start_offset),
+            end_date=None if end_offset is None else today + timedelta(days=end_offset),
         )
-        assert lease.is_active is False
+        assert lease.is_active is expected
 
 
 def describe_lease_is_active_start_date_boundary():
@@ -518,23 +436,21 @@ def describe_lease_is_active_start_date_boundary():
     This kills mutants that change ``>`` to ``>=`` or ``<=``.
     """
 
-    def it_is_active_when_start_date_equals_today():
+    def it_is_active_when_start_date_equals_today(today):
         """start_date == today means the lease has started; is_active is True.
 
         Kills ``> → >=``: with ``>=``, ``today >= today`` is True so the
         guard fires and is_active incorrectly returns False.
         """
-        today = timezone.now().date()
         lease = Lease(start_date=today, end_date=None)
         assert lease.is_active is True
 
-    def it_is_not_active_when_start_date_is_tomorrow():
+    def it_is_not_active_when_start_date_is_tomorrow(today):
         """start_date == tomorrow means the lease hasn't started; is_active is False.
 
         Kills ``> → <=``: with ``<=``, ``tomorrow <= today`` is False so the
         guard does NOT fire and is_active incorrectly returns True.
         """
-        today = timezone.now().date()
         lease = Lease(start_date=today + timedelta(days=1), end_date=None)
         assert lease.is_active is False
 
@@ -547,23 +463,21 @@ def describe_lease_is_active_end_date_boundary():
     This kills mutants that change ``<`` to ``<=`` or ``>=``.
     """
 
-    def it_is_active_when_end_date_equals_today():
+    def it_is_active_when_end_date_equals_today(today):
         """end_date == today means the lease is still active on its last day.
 
         Kills ``< → <=``: with ``<=``, ``today <= today`` is True so the
         guard fires and is_active incorrectly returns False.
         """
-        today = timezone.now().date()
         lease = Lease(start_date=today - timedelta(days=30), end_date=today)
         assert lease.is_active is True
 
-    def it_is_not_active_when_end_date_is_yesterday():
+    def it_is_not_active_when_end_date_is_yesterday(today):
         """end_date == yesterday means the lease has expired; is_active is False.
 
         Kills ``< → >=``: with ``>=``, ``yesterday >= today`` is False so the
         guard does NOT fire and is_active incorrectly returns True.
         """
-        today = timezone.now().date()
         lease = Lease(
             start_date=today - timedelta(days=30),
             end_date=today - timedelta(days=1),
@@ -578,21 +492,20 @@ def describe_lease_is_active_end_date_boundary():
 
 @pytest.mark.django_db
 def describe_space_sublet():
-    def it_defaults_to_null_sublet_guild():
-        space = SpaceFactory()
-        assert space.sublet_guild is None
+    def it_defaults_to_null_sublet_guild(shared_space):
+        assert shared_space.sublet_guild is None
 
     def it_assigns_and_persists_sublet_guild():
         guild = GuildFactory(name="Ceramics Guild")
         space = SpaceFactory(sublet_guild=guild)
-        space.refresh_from_db()
+        space.refresh_from_db(fields=["sublet_guild"])
         assert space.sublet_guild == guild
 
     def it_sets_null_on_guild_deletion():
         guild = GuildFactory(name="Temp Guild")
         space = SpaceFactory(sublet_guild=guild)
         guild.delete()
-        space.refresh_from_db()
+        space.refresh_from_db(fields=["sublet_guild"])
         assert space.sublet_guild is None
 
 
@@ -605,66 +518,67 @@ def describe_space_sublet():
 def describe_guild_sublet_revenue():
     def it_returns_zero_when_guild_has_no_sublets():
         guild = GuildFactory(name="No Sublets Guild")
-        assert guild.sublet_revenue == Decimal("0.00")
+        assert guild.sublet_revenue == D0
 
     def it_returns_zero_when_guild_has_sublets_but_no_leases():
         guild = GuildFactory(name="Empty Sublet Guild")
         SpaceFactory(sublet_guild=guild)
-        assert guild.sublet_revenue == Decimal("0.00")
+        assert guild.sublet_revenue == D0
 
     def it_calculates_revenue_from_single_active_lease():
         guild = GuildFactory(name="Single Lease Guild")
         space = SpaceFactory(sublet_guild=guild)
-        today = timezone.now().date()
         LeaseFactory(
             space=space,
-            monthly_rent=Decimal("350.00"),
-            start_date=today - timedelta(days=10),
+            monthly_rent=D350,
+            active=True,
         )
-        assert guild.sublet_revenue == Decimal("350.00")
+        assert guild.sublet_revenue == D350
 
-    def it_sums_revenue_from_multiple_active_leases_on_multiple_sublets():
+    def it_sums_revenue_from_multiple_active_leases_on_multiple_sublets(shared_member, today):
         guild = GuildFactory(name="Multi Lease Guild")
-        space_a = SpaceFactory(sublet_guild=guild)
-        space_b = SpaceFactory(sublet_guild=guild)
-        today = timezone.now().date()
-        LeaseFactory(
-            space=space_a,
-            monthly_rent=Decimal("200.00"),
-            start_date=today - timedelta(days=10),
+        space_a, space_b = create_spaces({"sublet_guild": guild}, {"sublet_guild": guild})
+        create_leases(
+            {
+                "tenant_obj": shared_member,
+                "space": space_a,
+                "monthly_rent": D200,
+                "active": True,
+            },
+            {
+                "tenant_obj": shared_member,
+                "space": space_b,
+                "monthly_rent": D300,
+                "start_date": today - timedelta(days=5),
+            },
         )
-        LeaseFactory(
-            space=space_b,
-            monthly_rent=Decimal("300.00"),
-            start_date=today - timedelta(days=5),
-        )
-        assert guild.sublet_revenue == Decimal("500.00")
+        assert guild.sublet_revenue == D500
 
     def it_excludes_expired_leases():
         guild = GuildFactory(name="Expired Lease Guild")
         space = SpaceFactory(sublet_guild=guild)
-        today = timezone.now().date()
         LeaseFactory(
             space=space,
-            monthly_rent=Decimal("400.00"),
-            start_date=today - timedelta(days=60),
-            end_date=today - timedelta(days=1),
+            monthly_rent=D400,
+            ended=True,
         )
-        assert guild.sublet_revenue == Decimal("0.00")
+        assert guild.sublet_revenue == D0
 
-    def it_excludes_leases_on_non_sublet_spaces():
+    def it_excludes_leases_on_non_sublet_spaces(shared_member):
         guild = GuildFactory(name="Non-Sublet Guild")
-        sublet_space = SpaceFactory(sublet_guild=guild)
-        non_sublet_space = SpaceFactory()  # no sublet_guild
-        today = timezone.now().date()
-        LeaseFactory(
-            space=sublet_space,
-            monthly_rent=Decimal("250.00"),
-            start_date=today - timedelta(days=10),
-        )
-        LeaseFactory(
-            space=non_sublet_space,
-            monthly_rent=Decimal("999.00"),
-            start_date=today - timedelta(days=10),
+        sublet_space, non_sublet_space = create_spaces({"sublet_guild": guild}, {})  # second has no sublet_guild
+        create_leases(
+            {
+                "tenant_obj": shared_member,
+                "space": sublet_space,
+                "monthly_rent": D250,
+                "active": True,
+            },
+            {
+                "tenant_obj": shared_member,
+                "space": non_sublet_space,
+                "monthly_rent": Decimal("999.00"),
+                "active": True,
+            },
         )
-        assert guild.sublet_revenue == Decimal("250.00")
+        assert guild.sublet_revenue == D250
@@ -1,291 +1,251 @@
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import patch
 
 import pytest
 from django.db.models import Q
-from django.utils import timezone
 
 from membership.models import Lease, Member, Space, _active_lease_q
 from tests.membership.factories import (
     LeaseFactory,
     MemberFactory,
-    MembershipPlanFactory,
     SpaceFactory,
+    create_leases,
+    create_members,
+    create_spaces,
 )
 
+D0 = Decimal("0.00")
+D100 = Decimal("100.00")
+D200 = Decimal("200.00")
+D300 = Decimal("300.00")
+D500 = Decimal("500.00")
+D750 = Decimal("750.00")
+
+
+def _expected_q(ref, prefix=""):
+    """The Q tree ``_active_lease_q`` should build for ``ref`` and ``prefix``."""
+    return Q(**{f"{prefix}start_date__lte": ref}) & (
+        Q(**{f"{prefix}end_date__isnull": True}) | Q(**{f"{prefix}end_date__gte": ref})
+    )
+
 
 def describe_active_lease_q():
-    def it_builds_q_with_default_prefix_and_today():
+    def it_builds_q_with_default_prefix_and_today(monkeypatch):
         ref = date(2025, 6, 15)
-        with patch("membership.models.timezone") as mock_tz:
-            mock_tz.now.return_value.date.return_value = ref
-            q = _active_lease_q()
-
-        expected = Q(start_date__lte=ref) & (Q(end_date__isnull=True) | Q(end_date__gte=ref))
-        assert q == expected
+        monkeypatch.setattr(
+            "membership.models.timezone.now",
+            lambda: datetime(2025, 6, 15, 12, tzinfo=UTC),
+        )
+        assert _active_lease_q() == _expected_q(ref)
 
     def it_uses_explicit_today_parameter():
         ref = date(2024, 12, 25)
-        q = _active_lease_q(today=ref)
-
-        expected = Q(start_date__lte=ref) & (Q(end_date__isnull=True) | Q(end_date__gte=ref))
-        assert q == expected
+        assert _active_lease_q(today=ref) == _expected_q(ref)
 
     def it_applies_prefix_to_field_names():
         ref = date(2025, 1, 1)
-        q = _active_lease_q(prefix="lease__", today=ref)
-
-        expected = Q(lease__start_date__lte=ref) & (Q(lease__end_date__isnull=True) | Q(lease__end_date__gte=ref))
-        assert q == expected
+        assert _active_lease_q(prefix="lease__", today=ref) == _expected_q(ref, prefix="lease__")
 
     def it_applies_leases_prefix_for_related_lookups():
         ref = date(2025, 3, 10)
-        q = _active_lease_q(prefix="leases__", today=ref)
-
-        expected = Q(leases__start_date__lte=ref) & (Q(leases__end_date__isnull=True) | Q(leases__end_date__gte=ref))
-        assert q == expected
+        assert _active_lease_q(prefix="leases__", today=ref) == _expected_q(ref, prefix="leases__")
 
 
 @pytest.mark.django_db
 def describe_member_queryset():
     def describe_active():
         def it_returns_only_active_members():
-            plan = MembershipPlanFactory()
-            active = MemberFactory(membership_plan=plan, full_legal_name="Active One", email="a@x.com")
-            MemberFactory(
-                membership_plan=plan,
-                full_legal_name="Former One",
-                email="f@x.com",
-                status=Member.Status.FORMER,
-            )
-            MemberFactory(
-                membership_plan=plan,
-                full_legal_name="Suspended One",
-                email="s@x.com",
-                status=Member.Status.SUSPENDED,
+            active, _, _ = create_members(
+                {"full_legal_name": "Active One", "email": "a@x.com"},
+                {
+                    "full_legal_name": "Former One",
+                    "email": "f@x.com",
+                    "status": Member.Status.FORMER,
+                },
+                {
+                    "full_legal_name": "Suspended One",
+                    "email": "s@x.com",
+                    "status": Member.Status.SUSPENDED,
+                },
             )
 
-            result = list(Member.objects.active())
-            assert result == [active]
+            result = list(Member.objects.active().values_list("pk", flat=True))
+            assert result == [active.pk]
 
-        def it_excludes_former_members():
-            plan = MembershipPlanFactory()
-            MemberFactory(
-                membership_plan=plan,
-                full_legal_name="Former",
-                email="f@x.com",
-                status=Member.Status.FORMER,
-            )
+        @pytest.mark.parametrize("status", [Member.Status.FORMER, Member.Status.SUSPENDED])
+        def it_excludes_inactive_members(status):
+            MemberFactory(status=status)
 
-            assert Member.objects.active().count() == 0
-
-        def it_excludes_suspended_members():
-            plan = MembershipPlanFactory()
-            MemberFactory(
-                membership_plan=plan,
-                full_legal_name="Suspended",
-                email="s@x.com",
-                status=Member.Status.SUSPENDED,
-            )
-
-            assert Member.objects.active().count() == 0
+            assert not Member.objects.active().exists()
 
     def describe_with_lease_totals():
-        def it_annotates_active_lease_count():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            today = timezone.now().date()
-
-            space1 = SpaceFactory(space_id="S-001")
-            space2 = SpaceFactory(space_id="S-002")
-
-            # Two active leases
-            LeaseFactory(
-                tenant_obj=member,
-                space=space1,
-                start_date=today - timedelta(days=30),
-                monthly_rent=Decimal("300.00"),
-            )
-            LeaseFactory(
-                tenant_obj=member,
-                space=space2,
-                start_date=today - timedelta(days=10),
-                monthly_rent=Decimal("200.00"),
+        # Both totals are annotations, so the annotated row costs one query.
+
+        def it_annotates_active_lease_count(django_assert_num_queries, today):
+            member = MemberFactory(email="m@x.com")
+            space1, space2, space3 = create_spaces({}, {}, {})
+
+            create_leases(
+                # Two active leases
+                {
+                    "tenant_obj": member,
+                    "space": space1,
+                    "start_date": today - timedelta(days=30),
+                    "monthly_rent": D300,
+                },
+                {
+                    "tenant_obj": member,
+                    "space": space2,
+                    "active": True,
+                    "monthly_rent": D200,
+                },
+                # One ended lease - should not count
+                {
+                    "tenant_obj": member,
+                    "space": space3,
+                    "start_date": today - timedelta(days=90),
+                    "end_date": today - timedelta(days=1),
+                    "monthly_rent": D100,
+                },
             )
 
-            # One ended lease - should not count
-            space3 = SpaceFactory(space_id="S-003")
-            LeaseFactory(
-                tenant_obj=member,
-                space=space3,
-                start_date=today - timedelta(days=90),
-                end_date=today - timedelta(days=1),
-                monthly_rent=Decimal("100.00"),
-            )
-
-            annotated = Member.objects.with_lease_totals().get(pk=member.pk)
+            with django_assert_num_queries(1):
+                annotated = Member.objects.with_lease_totals().get(pk=member.pk)
             assert annotated.active_lease_count == 2
 
-        def it_annotates_total_monthly_rent():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            today = timezone.now().date()
-
-            space1 = SpaceFactory(space_id="S-001")
-            space2 = SpaceFactory(space_id="S-002")
-
-            LeaseFactory(
-                tenant_obj=member,
-                space=space1,
-                start_date=today - timedelta(days=30),
-                monthly_rent=Decimal("300.00"),
-            )
-            LeaseFactory(
-                tenant_obj=member,
-                space=space2,
-                start_date=today - timedelta(days=10),
-                monthly_rent=Decimal("200.00"),
+        def it_annotates_total_monthly_rent(django_assert_num_queries, today):
+            member = MemberFactory(email="m@x.com")
+            space1, space2 = create_spaces({}, {})
+
+            create_leases(
+                {
+                    "tenant_obj": member,
+                    "space": space1,
+                    "start_date": today - timedelta(days=30),
+                    "monthly_rent": D300,
+                },
+                {
+                    "tenant_obj": member,
+                    "space": space2,
+                    "active": True,
+                    "monthly_rent": D200,
+                },
             )
 
-            annotated = Member.objects.with_lease_totals().get(pk=member.pk)
-            assert annotated.total_monthly_rent == Decimal("500.00")
+            with django_assert_num_queries(1):
+                annotated = Member.objects.with_lease_totals().get(pk=member.pk)
+            assert annotated.total_monthly_rent == D500
 
-        def it_handles_members_with_no_leases():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
+        def it_handles_members_with_no_leases(django_assert_num_queries):
+            member = MemberFactory(email="m@x.com")
 
-            annotated = Member.objects.with_lease_totals().get(pk=member.pk)
+            with django_assert_num_queries(1):
+                annotated = Member.objects.with_lease_totals().get(pk=member.pk)
             assert annotated.active_lease_count == 0
-            assert annotated.total_monthly_rent == Decimal("0.00")
+            assert annotated.total_monthly_rent == D0
 
 
 @pytest.mark.django_db
 def describe_space_queryset():
     def describe_available():
         def it_returns_only_available_spaces():
-            available = SpaceFactory(space_id="S-001", status=Space.Status.AVAILABLE)
-            SpaceFactory(space_id="S-002", status=Space.Status.OCCUPIED)
-            SpaceFactory(space_id="S-003", status=Space.Status.MAINTENANCE)
-
-            result = list(Space.objects.available())
-            assert result == [available]
-
-        def it_excludes_occupied_spaces():
-            SpaceFactory(space_id="S-001", status=Space.Status.OCCUPIED)
+            available, _, _ = create_spaces(
+                {"status": Space.Status.AVAILABLE},
+                {"status": Space.Status.OCCUPIED},
+                {"status": Space.Status.MAINTENANCE},
+            )
 
-            assert Space.objects.available().count() == 0
+            result = list(Space.objects.available().values_list("pk", flat=True))
+            assert result == [available.pk]
 
-        def it_excludes_maintenance_spaces():
-            SpaceFactory(space_id="S-001", status=Space.Status.MAINTENANCE)
+        @pytest.mark.parametrize("status", [Space.Status.OCCUPIED, Space.Status.MAINTENANCE])
+        def it_excludes_unavailable_spaces(status):
+            SpaceFactory(status=status)
 
-            assert Space.objects.available().count() == 0
+            assert not Space.objects.available().exists()
 
     def describe_with_revenue():
-        def it_annotates_active_lease_revenue():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001", status=Space.Status.OCCUPIED)
-            today = timezone.now().date()
+        def it_annotates_active_lease_revenue(shared_member, django_assert_num_queries, today):
+            space = SpaceFactory(status=Space.Status.OCCUPIED)
 
             LeaseFactory(
-                tenant_obj=member,
+                tenant_obj=shared_member,
                 space=space,
                 start_date=today - timedelta(days=30),
-                monthly_rent=Decimal("750.00"),
+                monthly_rent=D750,
             )
 
-            annotated = Space.objects.with_revenue().get(pk=space.pk)
-            assert annotated.active_lease_rent_total == Decimal("750.00")
+            with django_assert_num_queries(1):
+                annotated = Space.objects.with_revenue().get(pk=space.pk)
+            assert annotated.active_lease_rent_total == D750
 
-        def it_handles_spaces_with_no_leases():
+        def it_handles_spaces_with_no_leases(django_assert_num_queries):
             SpaceFactory(space_id="S-001")
 
-            annotated = Space.objects.with_revenue().get(space_id="S-001")
-            assert annotated.active_lease_rent_total == Decimal("0.00")
+            with django_assert_num_queries(1):
+                annotated = Space.objects.with_revenue().get(space_id="S-001")
+            assert annotated.active_lease_rent_total == D0
 
 
 @pytest.mark.django_db
 def describe_lease_queryset():
     def describe_active():
-        def it_returns_leases_active_today():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001")
-            today = timezone.now().date()
+        # The member and space are read-only scaffolding shared by the block;
+        # only the lease under test is created per spec.
 
+        def it_returns_leases_active_today(shared_member, shared_space, today):
             active_lease = LeaseFactory(
-                tenant_obj=member,
-                space=space,
+                tenant_obj=shared_member,
+                space=shared_space,
                 start_date=today - timedelta(days=30),
                 end_date=today + timedelta(days=30),
             )
 
-            result = list(Lease.objects.active())
-            assert result == [active_lease]
-
-        def it_returns_leases_active_as_of_specific_date():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001")
+            result = list(Lease.objects.active().values_list("pk", flat=True))
+            assert result == [active_lease.pk]
 
+        def it_returns_leases_active_as_of_specific_date(shared_member, shared_space):
             lease = LeaseFactory(
-                tenant_obj=member,
-                space=space,
+                tenant_obj=shared_member,
+                space=shared_space,
                 start_date=date(2024, 3, 1),
                 end_date=date(2024, 6, 30),
             )
 
             # Should include when as_of is within range
-            result = list(Lease.objects.active(as_of=date(2024, 4, 15)))
-            assert result == [lease]
+            result = list(Lease.objects.active(as_of=date(2024, 4, 15)).values_list("pk", flat=True))
+            assert result == [lease.pk]
 
             # Should exclude when as_of is outside range
-            result = list(Lease.objects.active(as_of=date(2024, 7, 1)))
-            assert result == []
-
-        def it_excludes_ended_leases():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001")
-            today = timezone.now().date()
+            assert not Lease.objects.active(as_of=date(2024, 7, 1)).exists()
 
+        def it_excludes_ended_leases(shared_member, shared_space, today):
             LeaseFactory(
-                tenant_obj=member,
-                space=space,
+                tenant_obj=shared_member,
+                space=shared_space,
                 start_date=today - timedelta(days=90),
                 end_date=today - timedelta(days=1),
             )
 
-            assert Lease.objects.active().count() == 0
-
-        def it_excludes_future_leases():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001")
-            today = timezone.now().date()
+            assert not Lease.objects.active().exists()
 
+        def it_excludes_future_leases(shared_member, shared_space, today):
             LeaseFactory(
-                tenant_obj=member,
-                space=space,
+                tenant_obj=shared_member,
+                space=shared_space,
                 start_date=today + timedelta(days=30),
                 end_date=today + timedelta(days=90),
             )
 
-            assert Lease.objects.active().count() == 0
-
-        def it_includes_ongoing_leases_with_no_end_date():
-            plan = MembershipPlanFactory()
-            member = MemberFactory(membership_plan=plan, email="m@x.com")
-            space = SpaceFactory(space_id="S-001")
-            today = timezone.now().date()
+            assert not Lease.objects.active().exists()
 
+        def it_includes_ongoing_leases_with_no_end_date(shared_member, shared_space, today):
             ongoing = LeaseFactory(
-                tenant_obj=member,
-                space=space,
+                tenant_obj=shared_member,
+                space=shared_space,
                 start_date=today - timedelta(days=60),
                 end_date=None,
             )
 
-            result = list(Lease.objects.active())
-            assert result == [ongoing]
+            result = list(Lease.objects.active().values_list("pk", flat=True))
+            assert result == [ongoing.pk]
@@ -311,7 +311,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is True
         assert user.is_superuser is True
 
@@ -331,7 +331,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is False
         assert user.is_superuser is False
 
@@ -394,7 +394,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is True
         assert user.is_superuser is True
 
@@ -414,7 +414,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is True
         assert user.is_superuser is True
 
@@ -434,7 +434,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is False
         assert user.is_superuser is False
 
@@ -476,7 +476,7 @@ def describe_pre_social_login():
         sociallogin = _make_existing_social_login(user)
         adapter.pre_social_login(request, sociallogin)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["is_staff", "is_superuser"])
         assert user.is_staff is True
         assert user.is_superuser is True
 